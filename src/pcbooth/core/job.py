@@ -147,7 +147,7 @@ class UserAnimationJob(Job):
         with self.context:
             self._parse_frames()
             if "from_blend" not in self.frames:
-                set_frame_range(min(self.frames), max(self.frames))
+                set_frame_range(self.start_frame, self.end_frame)
             if not self.report():
                 self.iterate()
         studio.clear_animation_data()
@@ -164,11 +164,9 @@ class UserAnimationJob(Job):
         frames = self.params.get("FRAMES", _DEFAULT_FRAMES)
         if not frames:
             return ""
-        end_frame = max(self.frames)
-        start_frame = min(self.frames)
-        if frame == end_frame and "end" in frames:
+        if frame == self.end_frame and "end" in frames:
             return "_end"
-        elif frame == start_frame and "start" in frames:
+        elif frame == self.start_frame and "start" in frames:
             return "_start"
         return f"_{frame:04d}"
 
@@ -194,3 +192,5 @@ class UserAnimationJob(Job):
         else:
             frame_map = {"start": self.studio.frame_start, "end": self.studio.frame_end}
             self.frames = {frame_map.get(frame, frame) for frame in frames}
+        self.start_frame: int = min(self.frames)
+        self.end_frame: int = max(self.frames)
@@ -29,11 +29,11 @@ class BaseSchema(Schema):
 class Color(fields.Field):
     """Custom Marshmallow field for validating color as a hex value."""
 
-    HEX_PATTERN = r"^#?([0-9A-Fa-f]{6})$"
+    HEX_PATTERN = re.compile(r"^#?([0-9A-Fa-f]{6})$")
 
     def _deserialize(self, value: str, attr: Any, data: Any, **kwargs: Any) -> str:
         if isinstance(value, str):
-            if match := re.match(self.HEX_PATTERN, value):
+            if match := self.HEX_PATTERN.match(value):
                 return match.group(0)
 
         raise ValidationError(f"Not a valid color format (expected RGB hex value like AABBCC)")
@@ -57,13 +57,13 @@ class FileFormat(fields.Field):
 class FocalRatio(fields.Field):
     """Custom Marshmallow field for validating focal ratio strings."""
 
-    FR_PATTERN = r"^[1f]\/\d+$"
+    FR_PATTERN = re.compile(r"^[1f]\/\d+$")
 
     def _deserialize(self, value: str, attr: Any, data: Any, **kwargs: Any) -> float | str:
         if isinstance(value, str):
             if value == "auto":
                 return value
-            if match := re.match(self.FR_PATTERN, value):
+            if match := self.FR_PATTERN.match(value):
                 return eval(match.group(0).replace("f", "1"))
 
         if isinstance(value, float):
@@ -75,11 +75,11 @@ class FocalRatio(fields.Field):
 class DataBlock(fields.Field):
     """Custom Marshmallow field for validating if string represents Blender data-block (Collection or Object)"""
 
-    DB_PATTERN = r"^(Collection|Object)([^\w\s])(.+)$"
+    DB_PATTERN = re.compile(r"^(Collection|Object)([^\w\s])(.+)$")
 
     def _deserialize(self, value: str, attr: Any, data: Any, **kwargs: Any) -> List[str]:
         if isinstance(value, str):
-            if match := re.match(self.DB_PATTERN, value):
+            if match := self.DB_PATTERN.match(value):
                 return [match.group(1), match.group(3)]
 
         raise ValidationError(f"Not a valid <type>/<name> string defining Blender data-block")
@@ -25,28 +25,25 @@ class Animation(UserAnimationJob):
             logger.warning("There's no user-defined actions in this .blend file, nothing to render within this job.")
             return
 
-        ffmpeg = FFmpegWrapper()
-        renderer = RendererWrapper()
-        total_renders = len(self.studio.cameras) * len(self.studio.positions) * len(self.studio.backgrounds)
-
-        self.update_status(total_renders)
-        for position in self.studio.positions:
-            self.studio.change_position(position)
-            Background.update_position(self.studio.top_parent)
-            for background in self.studio.backgrounds:
-                Background.use(background)
-                for camera in self.studio.cameras:
-                    camera.change_position(position)
-                    self.studio.add_studio_keyframes(camera)
-
-                    filename = f"{camera.name.lower()}{position[0]}_{background.name}_animation"
-                    rev_filename = f"{camera.name.lower()}{position[0]}_{background.name}_animation_reversed"
-                    renderer.render_animation(camera.object, filename)
-
-                    ffmpeg.run(filename, filename)
-                    ffmpeg.reverse(filename, rev_filename)
-                    ffmpeg.thumbnail(filename)
-                    ffmpeg.thumbnail(rev_filename)
-                    self.update_status()
-
-        ffmpeg.clear_frames()
+        with FFmpegWrapper() as ffmpeg:
+            renderer = RendererWrapper()
+            total_renders = len(self.studio.cameras) * len(self.studio.positions) * len(self.studio.backgrounds)
+
+            self.update_status(total_renders)
+            for position in self.studio.positions:
+                self.studio.change_position(position)
+                Background.update_position(self.studio.top_parent)
+                for background in self.studio.backgrounds:
+                    Background.use(background)
+                    for camera in self.studio.cameras:
+                        camera.change_position(position)
+                        self.studio.add_studio_keyframes(camera)
+
+                        filename = f"{camera.name.lower()}{position[0]}_{background.name}_animation"
+                        rev_filename = f"{filename}_reversed"
+                        renderer.render_animation(camera.object, filename)
+
+                        ffmpeg.submit(filename, rev_filename)
+                        self.update_status()
+
+            ffmpeg.clear_frames()
@@ -41,33 +41,37 @@ class CameraTransition(pcbooth.core.job.Job):
         """
         Main loop of the module to be run within execute() method.
         """
-        ffmpeg = FFmpegWrapper()
-        renderer = RendererWrapper()
-        Background.use(self.studio.backgrounds[0])
         pairs = list(combinations(self.studio.cameras, 2))
-        total_renders = len(pairs) * len(self.studio.positions)
-        logger.debug(f"Combined pairs: {pairs}")
-        self.update_status(total_renders)
-        for position in self.studio.positions:
-            self.studio.change_position(position)
-            Light.update(self.studio.top_parent)
-            for pair in pairs:
-                camera_start = pair[0]
-                camera_end = pair[1]
-                camera_start.change_position(position)
-                camera_end.change_position(position)
+        if not pairs:
+            logger.warning(
+                "At least two cameras are needed to render camera transitions, nothing to render within this job."
+            )
+            return
+
+        with FFmpegWrapper() as ffmpeg:
+            renderer = RendererWrapper()
+            Background.use(self.studio.backgrounds[0])
+            total_renders = len(pairs) * len(self.studio.positions)
+            logger.debug(f"Combined pairs: {pairs}")
+            self.update_status(total_renders)
+            for position in self.studio.positions:
+                self.studio.change_position(position)
+                Light.update(self.studio.top_parent)
+                names = {camera: f"{camera.name.lower()}{position[0]}" for camera in self.studio.cameras}
+                for pair in pairs:
+                    camera_start = pair[0]
+                    camera_end = pair[1]
+                    camera_start.change_position(position)
+                    camera_end.change_position(position)
 
-                filename = f"{camera_start.name.lower()}{position[0]}_{camera_end.name.lower()}{position[0]}"
-                rev_filename = f"{camera_end.name.lower()}{position[0]}_{camera_start.name.lower()}{position[0]}"
-                self.create_keyframes(camera_start, camera_end, position)
-                renderer.render_animation(camera_start.object, filename)
-                ffmpeg.run(filename, filename)
-                ffmpeg.reverse(filename, rev_filename)
-                ffmpeg.thumbnail(filename)
-                ffmpeg.thumbnail(rev_filename)
-                self.update_status()
-                self.studio.clear_animation_data()
-        ffmpeg.clear_frames()
+                    filename = f"{names[camera_start]}_{names[camera_end]}"
+                    rev_filename = f"{names[camera_end]}_{names[camera_start]}"
+                    self.create_keyframes(camera_start, camera_end, position)
+                    renderer.render_animation(camera_start.object, filename)
+                    ffmpeg.submit(filename, rev_filename)
+                    self.update_status()
+                    self.studio.clear_animation_data()
+            ffmpeg.clear_frames()
 
     def create_keyframes(self, camera_start: Camera, camera_end: Camera, position: str) -> None:
         scene = bpy.context.scene
@@ -32,30 +32,33 @@ class FlipTransition(pcbooth.core.job.Job):
         """
         Main loop of the module to be run within execute() method.
         """
-        ffmpeg = FFmpegWrapper()
-        renderer = RendererWrapper()
-        Background.use(self.studio.backgrounds[0])
         pairs = list(combinations(self.studio.positions, 2))
-        total_renders = len(pairs) * len(self.studio.cameras)
-        self.update_status(total_renders)
-
-        for pair in pairs:
-            self.create_model_keyframes(pair)
-            for camera in self.studio.cameras:
+        if not pairs:
+            logger.warning(
+                "At least two positions are needed to render flip transitions, nothing to render within this job."
+            )
+            return
+
+        with FFmpegWrapper() as ffmpeg:
+            renderer = RendererWrapper()
+            Background.use(self.studio.backgrounds[0])
+            total_renders = len(pairs) * len(self.studio.cameras)
+            self.update_status(total_renders)
+            camera_names = [(camera, camera.name.lower()) for camera in self.studio.cameras]
+
+            for pair in pairs:
+                self.create_model_keyframes(pair)
                 pos_start = pair[0]
                 pos_end = pair[1]
-
-                filename = f"{camera.name.lower()}{pos_start[0]}_{camera.name.lower()}{pos_end[0]}"
-                rev_filename = f"{camera.name.lower()}{pos_end[0]}_{camera.name.lower()}{pos_start[0]}"
-                self.create_camera_keyframes(camera, pair)
-                renderer.render_animation(camera.object, filename)
-                ffmpeg.run(filename, filename)
-                ffmpeg.reverse(filename, rev_filename)
-                ffmpeg.thumbnail(filename)
-                ffmpeg.thumbnail(rev_filename)
-                self.update_status()
-            self.studio.clear_animation_data()
-        ffmpeg.clear_frames()
+                for camera, camera_name in camera_names:
+                    filename = f"{camera_name}{pos_start[0]}_{camera_name}{pos_end[0]}"
+                    rev_filename = f"{camera_name}{pos_end[0]}_{camera_name}{pos_start[0]}"
+                    self.create_camera_keyframes(camera, pair)
+                    renderer.render_animation(camera.object, filename)
+                    ffmpeg.submit(filename, rev_filename)
+                    self.update_status()
+                self.studio.clear_animation_data()
+            ffmpeg.clear_frames()
 
     def create_model_keyframes(self, pair: Tuple[str, str]) -> None:
         scene = bpy.context.scene
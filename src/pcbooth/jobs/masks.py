@@ -54,12 +54,12 @@ class Masks(UserAnimationJob):
         len_params = sum(value is True for value in self.params.values())
 
         len_bottom_highlighted = (
-            len([component for component in highlighted if self.is_skipped(component, "TOP")])
+            sum(1 for component in highlighted if self.is_skipped(component, "TOP"))
             if "BOTTOM" in self.studio.positions and self.studio.is_pcb
             else 0
         )
         len_top_highlighted = (
-            len([component for component in highlighted if self.is_skipped(component, "BOTTOM")])
+            sum(1 for component in highlighted if self.is_skipped(component, "BOTTOM"))
             if "TOP" in self.studio.positions and self.studio.is_pcb
             else 0
         )
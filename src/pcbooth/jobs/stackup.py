@@ -13,6 +13,8 @@ from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+IDX_PATTERN = re.compile(r"(\d+)$")
+
 
 class Stackup(pcbooth.core.job.Job):
     """
@@ -43,7 +45,7 @@ class Stackup(pcbooth.core.job.Job):
             return
         rendered_children = self.studio.rendered_obj.children
         layers = sorted(
-            [layer for layer in rendered_children if "PCB_layer" in layer.name],
+            (layer for layer in rendered_children if "PCB_layer" in layer.name),
             key=get_idx,
         )
         if len(layers) < 2:
@@ -84,7 +86,7 @@ class Stackup(pcbooth.core.job.Job):
 
 def get_idx(object: bpy.types.Object) -> int:
     """Get index from the object name"""
-    match = re.search(r"(\d+)$", object.name)
+    match = IDX_PATTERN.search(object.name)
     return int(match.group(1)) if match else 0
 
 
@@ -42,9 +42,10 @@ class Static(UserAnimationJob):
                     if self.has_animation_data:
                         self.studio.add_studio_keyframes(camera)
 
+                    file_prefix = f"{camera.name.lower()}{position[0]}_{background.name}"
                     for frame in self.frames:
                         bpy.context.scene.frame_set(frame)
-                        filename = f"{camera.name.lower()}{position[0]}_{background.name}{self.get_frame_suffix(frame)}"
+                        filename = f"{file_prefix}{self.get_frame_suffix(frame)}"
 
                         renderer.render(camera.object, filename)
                         renderer.thumbnail(camera.object, filename)
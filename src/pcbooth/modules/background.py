@@ -2,7 +2,7 @@
 
 import bpy
 import logging
-from typing import List, ClassVar, Optional
+from typing import List, Dict, ClassVar, Optional
 
 import pcbooth.modules.config as config
 import pcbooth.modules.file_io as fio
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 
 class Background:
     objects: ClassVar[List["Background"]] = []
+    _by_name: ClassVar[Dict[str, "Background"]] = {}
     collection: bpy.types.Collection
     files: List[str] = []
 
@@ -32,9 +33,8 @@ class Background:
     @classmethod
     def get(cls, name: str) -> Optional["Background"]:
         """Get Camera object by name string."""
-        for object in cls.objects:
-            if object.name == name:
-                return object
+        if object := cls._by_name.get(name):
+            return object
         logger.warning(f"Background: {name} not found.")
         return None
 
@@ -42,24 +42,32 @@ class Background:
     def update_position(cls, object: bpy.types.Object) -> None:
         """Update position of all imported backgrounds in relation to current lowest point of rendered object."""
         with Bounds(cu.select_all(object)) as target:
-            for bg in cls.objects:
-                bg.object.location.z = target.min_z
-        logger.debug(f"Backgrounds moved to Z: {bg.object.location.z}")
+            min_z = target.min_z
+        for bg in cls.objects:
+            if bg.object.location.z != min_z:
+                bg.object.location.z = min_z
+        logger.debug(f"Backgrounds moved to Z: {min_z}")
         cu.update_depsgraph()
 
     @classmethod
     def use(cls, background: "Background") -> None:
-        """Make specified background enabled for rendering."""
+        """
+        Make specified background enabled for rendering.
+        Visibility is only written when it changes, other overrides may toggle it in the meantime.
+        """
         for bg in cls.objects:
-            bg.object.hide_render = True
-        background.object.hide_render = False
+            hide = bg is not background
+            if bg.object.hide_render != hide:
+                bg.object.hide_render = hide
+        if background.object.hide_render:
+            background.object.hide_render = False
         logger.debug(f"Enabling '{background.object.name}' background for render.")
 
     @classmethod
     def keyframe_all(cls, frame: int) -> None:
-        """Keyframe all Background objects."""
+        """Keyframe all Background objects. Only Z location is ever updated, so only that channel is keyed."""
         for bg in cls.objects:
-            bg.object.keyframe_insert(data_path="location", frame=frame)
+            bg.object.keyframe_insert(data_path="location", index=2, frame=frame)
 
     def __init__(self, name: str = "") -> None:
         if not Background.collection:
@@ -80,18 +88,20 @@ class Background:
             object = cu.add_empty("transparent", Background.collection)
             logger.debug(f"Added background placeholder object: {object.name}")
             Background.objects.append(self)
+            Background._by_name.setdefault(name, self)
+
+        elif (bg_data := fio.get_data_from_blendfile(blendfile, "collections")) and (
+            linked_object := fio.link_collection_from_blendfile(blendfile, bg_data[0])
+        ):
+            object = linked_object
+            cu.link_obj_to_collection(object, Background.collection)
+            logger.debug(f"Added background linked object: {object.name} from {blendfile}")
+            Background.objects.append(self)
+            Background._by_name.setdefault(name, self)
 
-        elif bg_data := fio.get_data_from_blendfile(blendfile, "collections"):
-            bg_collection = bg_data[0]
-            linked_object = fio.link_collection_from_blendfile(blendfile, bg_collection)
-            if linked_object:
-                object = linked_object
-                cu.link_obj_to_collection(object, Background.collection)
-                logger.debug(f"Added background linked object: {object.name} from {blendfile}")
-                Background.objects.append(self)
-            else:
-                object = cu.add_empty(name, Background.collection)
-                logger.warning(f"'{name}' background not added!")
+        else:
+            object = cu.add_empty(name, Background.collection)
+            logger.warning(f"'{name}' background not added!")
 
         object.name = name
         object.location.z = 0
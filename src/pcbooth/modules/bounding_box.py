@@ -1,16 +1,19 @@
 """Bounding box calculation module."""
 
 import bpy
-from typing import List, Tuple, Self, Type
-from mathutils import Vector
+import cProfile
+import io
+import pstats
+import numpy as np
+from numpy.typing import NDArray
+from typing import Iterator, List, Tuple, Self, Type
+from mathutils import Matrix, Vector
 import logging
 import pcbooth.modules.custom_utilities as cu
 from types import TracebackType
 
 logger = logging.getLogger(__name__)
 
-BOUNDS_NAME = "_bounds"
-
 
 class BoundsVerticesCreationError(Exception):
     """Bounds generation error."""
@@ -21,27 +24,39 @@ class BoundsVerticesCreationError(Exception):
 class Bounds:
     """
     Context manager class.
-    Generate single bounds object consisting of bounding boxes of objects passed as a list.
-    This object can be then used to determine entire list's total dimensions. Bounds object
-    gets removed on context mangers' exit.
+    Calculate single axis-aligned bounding box enclosing bounding boxes of objects passed as a list.
+    This can be then used to determine entire list's total dimensions. Bounds are calculated
+    analytically, no helper object is added to the scene.
     Attributes:
         objects :
             list of objects used to create an instance of Bounds class
-        bounds :
-            Blender bounds object made out of bounding box vertices of objects from objects list
+        mins :
+            minimum corner of the bounding box
+        maxs :
+            maximum corner of the bounding box
+        center :
+            center point of the bounding box
+        dimensions :
+            size of the bounding box along each axis
         min_z :
             lowest vertex Z value
         max_z :
             highest vertex Z value
     """
 
+    __slots__ = ("objects", "mins", "maxs", "center", "dimensions", "min_z", "max_z")
+
     def __init__(self, objects: List[bpy.types.Object]) -> None:
-        """Initialize bounds context manager and create bounds empty object."""
+        """Initialize bounds context manager and calculate bounding box extents."""
 
         self.objects: List[bpy.types.Object] = objects
-        self.bounds: bpy.types.Object = generate_bounds(self.objects)
-        self.min_z: float = self._get_min_z()
-        self.max_z: float = self._get_max_z()
+        mins, maxs = compute_bbox_extents(self.objects)
+        self.mins: Vector = Vector(mins.tolist())
+        self.maxs: Vector = Vector(maxs.tolist())
+        self.center: Vector = (self.mins + self.maxs) / 2
+        self.dimensions: Vector = self.maxs - self.mins
+        self.min_z: float = self.mins.z
+        self.max_z: float = self.maxs.z
 
     def __enter__(self) -> Self:
         """Return Bounds object."""
@@ -53,114 +68,84 @@ class Bounds:
         exc_value: BaseException | None,
         exc_traceback: TracebackType | None,
     ) -> None:
-        """Remove bounds data from scene."""
-        self.clear()
+        """Nothing is added to the scene, so there is nothing to clean up."""
+        pass
 
-    def _get_min_z(self) -> float:
-        """Get lowest Z coordinate of all bounding box vertices coordinates of an object"""
-        current_vertices = [Vector(v[:]) @ self.bounds.matrix_world for v in self.bounds.bound_box]  # type: ignore
-        return min([v.z for v in current_vertices])
 
-    def _get_max_z(self) -> float:
-        """Get highest Z coordinate of all bounding box vertices coordinates of an object"""
-        current_vertices = [Vector(v[:]) @ self.bounds.matrix_world for v in self.bounds.bound_box]  # type: ignore
-        return max([v.z for v in current_vertices])
-
-    def clear(self) -> None:
-        """Clear bounds object data."""
-        bpy.data.meshes.remove(self.bounds.data)  # type: ignore
+def _iter_bound_boxes(objects: List[bpy.types.Object]) -> Iterator[NDArray[np.float64]]:
+    """
+    Yield world space bounding box vertices of objects passed as a list, as (8, 3) array per object.
+    Raises BoundsVerticesCreationError if none of the objects has a bounding box.
+    """
+    found = False
+    for obj in objects:
+        if obj.is_library_indirect:
+            continue
+        found = True
+        if instances := cu.get_library_instances(obj):
+            yield _get_translations_from_link(instances[0], obj)
+        else:
+            yield _get_translations_local(obj)
+    if not found:
+        raise BoundsVerticesCreationError("No vertices found in children objects, can't generate Bounds.")
 
 
 def get_vertices(
     objects: List[bpy.types.Object],
-) -> List[Vector]:
-    """Get list of all vertices of objects passed as a list."""
-    vertices = []
-    objects_list = [obj for obj in objects if not obj.is_library_indirect]
-    for obj in objects_list:
-        _bbox = []
-        if instances := cu.get_library_instances(obj):
-            _bbox = next((_get_translations_from_link(i, obj) for i in instances), [])
-        else:
-            _bbox = _get_translations_local(obj)
-        vertices.extend(_bbox)
+) -> NDArray[np.float64]:
+    """Get (N, 3) array of all bounding box vertices of objects passed as a list."""
+    return np.concatenate(list(_iter_bound_boxes(objects)))
 
-    if not vertices:
-        raise BoundsVerticesCreationError(f"No vertices found in children objects, can't generate Bounds.")
 
-    return vertices
+def compute_bbox_extents(objects: List[bpy.types.Object]) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Get minimum and maximum corner of bounding box of objects passed as a list.
+    Extents are reduced object by object, without collecting all vertices first.
+    """
+    bboxes = _iter_bound_boxes(objects)
+    first = next(bboxes)
+    mins = first.min(axis=0)
+    maxs = first.max(axis=0)
+    for bbox in bboxes:
+        np.minimum(mins, bbox.min(axis=0), out=mins)
+        np.maximum(maxs, bbox.max(axis=0), out=maxs)
+    return mins, maxs
 
 
-def _get_translations_from_link(obj: bpy.types.Object, lib_obj: bpy.types.Object) -> List[Vector]:
+def _get_translations_from_link(obj: bpy.types.Object, lib_obj: bpy.types.Object) -> NDArray[np.float64]:
     """
     Get matrix world translations from the local object and apply it to object's bounding box vertices,
-    then apply translations from the linked source.
+    then apply translations from the linked source. Both matrices are combined before transforming vertices.
     """
-    bbox_obj_verts = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]  # type: ignore
-    bbox_lib_verts = [lib_obj.matrix_world @ corner for corner in bbox_obj_verts]
-    return bbox_lib_verts
+    return _transform_bound_box(obj, lib_obj.matrix_world @ obj.matrix_world)
 
 
-def _get_translations_local(obj: bpy.types.Object) -> List[Vector]:
+def _get_translations_local(obj: bpy.types.Object) -> NDArray[np.float64]:
     """Get matrix world translations from the local object and apply it to object's bounding box vertices."""
-    return [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]  # type: ignore
+    return _transform_bound_box(obj, obj.matrix_world)
+
+
+def _transform_bound_box(obj: bpy.types.Object, matrix: Matrix) -> NDArray[np.float64]:
+    """Transform object's bounding box vertices using 4x4 matrix, return them as (8, 3) array."""
+    corners = np.asarray(obj.bound_box, dtype=np.float64)  # type: ignore
+    transform = np.asarray(matrix, dtype=np.float64)
+    return corners @ transform[:3, :3].T + transform[:3, 3]
 
 
-def generate_bbox(objects: List[bpy.types.Object]) -> bpy.types.Object:
+def profile_bounds(objects: List[bpy.types.Object], iterations: int = 100, top: int = 20) -> str:
     """
-    Generate bounding box EMPTY object using both locally added and linked objects.
+    Profile repeated Bounds construction for objects passed as a list using cProfile.
+    Can be used to check whether bounds calculation is dominated by Python overhead or by Blender internals.
+    Returns statistics of `top` functions sorted by internal time, they are also logged on debug level.
     """
-    vertices = get_vertices(objects)
-    bbox_verts = calculate_bbox(vertices)
-    obj = generate_mesh(bbox_verts)
-
-    logger.debug(f"Generated bounding box object {obj} ({bbox_verts})")
-    return obj
-
-
-def generate_bounds(objects: List[bpy.types.Object]) -> bpy.types.Object:
-    """Generate EMPTY object out of cloud of vertices using both locally added and linked objects."""
-    vertices = get_vertices(objects)
-    obj = generate_mesh(vertices)
-
-    logger.debug(f"Generated bounds object {obj}")
-    return obj
-
-
-def generate_mesh(vertices: List[Tuple[float, float, float]] | List[Vector]) -> bpy.types.Object:
-    """Generate mesh from vertices, edges and faces lists"""
-    mesh = bpy.data.meshes.new(BOUNDS_NAME)
-    mesh.from_pydata(vertices, [], [])
-    mesh.update()
-    obj = bpy.data.objects.new(BOUNDS_NAME, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    return obj
-
-
-def calculate_bbox(
-    vector: List[Vector],
-) -> List[Tuple[float, float, float]]:
-    """Calculate bounding box in form of list of tuples from provided list of points"""
-    # Initialize min and max values with the coordinates of the first point
-    min_x, min_y, min_z = max_x, max_y, max_z = vector[0].x, vector[0].y, vector[0].z
-
-    # Update min and max values by iterating through the list of points
-    for point in vector:
-        min_x = min(min_x, point.x)
-        min_y = min(min_y, point.y)
-        min_z = min(min_z, point.z)
-        max_x = max(max_x, point.x)
-        max_y = max(max_y, point.y)
-        max_z = max(max_z, point.z)
-    # Construct the 8-point bounding box coordinates
-    bounding_box = [
-        (min_x, min_y, min_z),
-        (min_x, max_y, min_z),
-        (max_x, max_y, min_z),
-        (max_x, min_y, min_z),
-        (min_x, min_y, max_z),
-        (min_x, max_y, max_z),
-        (max_x, max_y, max_z),
-        (max_x, min_y, max_z),
-    ]
-    return bounding_box
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(iterations):
+        with Bounds(objects):
+            pass
+    profiler.disable()
+
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats(pstats.SortKey.TIME).print_stats(top)
+    logger.debug(f"Bounds profile ({iterations} iterations, {len(objects)} objects):\n{output.getvalue()}")
+    return output.getvalue()
@@ -2,7 +2,7 @@
 
 import bpy
 import pcbooth.modules.custom_utilities as cu
-from pcbooth.modules.bounding_box import Bounds
+from pcbooth.modules.bounding_box import Bounds, get_vertices
 import pcbooth.modules.config as config
 from math import radians
 from mathutils import Matrix
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 class Camera:
     objects: ClassVar[List["Camera"]] = []
+    _by_name: ClassVar[Dict[str, "Camera"]] = {}
+    _defer_updates: ClassVar[bool] = False
     collection: bpy.types.Collection
 
     presets = {
@@ -37,12 +39,25 @@ class Camera:
     @classmethod
     def get(cls, name: str) -> Optional["Camera"]:
         """Get Camera object by name string."""
-        for object in cls.objects:
-            if object.name == name:
-                return object
+        if object := cls._by_name.get(name):
+            return object
         logger.warning(f"Camera: {name} not found.")
         return None
 
+    @classmethod
+    @contextmanager
+    def deferred_updates(cls) -> Generator[None, Any, None]:
+        """
+        Defer dependency graph updates of change_position calls until exiting the context.
+        Use when moving multiple cameras at once, without reading their positions in between.
+        """
+        cls._defer_updates = True
+        try:
+            yield
+        finally:
+            cls._defer_updates = False
+            cu.update_depsgraph()
+
     def __init__(
         self,
         name: str = "",
@@ -75,27 +90,31 @@ class Camera:
             object = camera
             self.name = "CUSTOM"
             self.custom = True
+            cu.link_obj_to_collection(object, Camera.collection)
         else:
             camera_name = "camera_" + name.lower()
             new_camera = bpy.data.cameras.new(camera_name)
             object = bpy.data.objects.new(camera_name, new_camera)
             object.rotation_euler = rotation
-        cu.link_obj_to_collection(object, Camera.collection)
+            Camera.collection.objects.link(object)
 
         logger.debug(f"Added camera object: {object.name} at {object.rotation_euler}, {object.location}")
         Camera.objects.append(self)
+        Camera._by_name.setdefault(self.name, self)
         return object
 
     def _set_defaults(self) -> None:
         """Set default camera properties"""
-        self.object.data.type = "PERSP"  # type: ignore
-        self.object.data.lens = 1000 if config.blendcfg["SCENE"]["ORTHO_CAM"] else config.blendcfg["SCENE"]["FOCAL_LENGTH"]  # type: ignore
-        self.object.data.clip_start = 0.1  # type: ignore
-        self.object.data.clip_end = 15000  # type: ignore # set long clip end for renders
-        if config.blendcfg["SCENE"]["DEPTH_OF_FIELD"]:
-            self.object.data.dof.use_dof = True  # type: ignore
+        scene_cfg = config.blendcfg["SCENE"]
+        camera = self.object.data
+        camera.type = "PERSP"  # type: ignore
+        camera.lens = 1000 if scene_cfg["ORTHO_CAM"] else scene_cfg["FOCAL_LENGTH"]  # type: ignore
+        camera.clip_start = 0.1  # type: ignore
+        camera.clip_end = 15000  # type: ignore # set long clip end for renders
+        if scene_cfg["DEPTH_OF_FIELD"]:
+            camera.dof.use_dof = True  # type: ignore
         self._sensor_default: float = 36.0
-        self._sensor_zoomedout: float = config.blendcfg["SCENE"]["ZOOM_OUT"] * self._sensor_default
+        self._sensor_zoomedout: float = scene_cfg["ZOOM_OUT"] * self._sensor_default
 
     def save_position(self, key: str) -> None:
         """
@@ -110,10 +129,8 @@ class Camera:
         Save focus parameters of the camera to the dictionary under provided key.
         Value is a tuple of (focus_distance, aperture_fstop)
         """
-        self.focuses[key] = (
-            self.object.data.dof.focus_distance,  # type: ignore
-            self.object.data.dof.aperture_fstop,  # type: ignore
-        )
+        dof = self.object.data.dof  # type: ignore
+        self.focuses[key] = (dof.focus_distance, dof.aperture_fstop)
         logger.debug(f"Saved {self.object.name} focus: \n{self.focuses[key]} as '{key}'")
 
     def change_position(self, key: str) -> None:
@@ -123,43 +140,54 @@ class Camera:
         self.object.matrix_world = self.positions[key].copy()
         self.change_focus(key)
         logger.debug(f"Moved {self.object.name} to '{key}' position.")
-        cu.update_depsgraph()
+        if not Camera._defer_updates:
+            cu.update_depsgraph()
 
     def change_focus(self, key: str) -> None:
         """
         Use camera focus parameters from position saved in dictionary.
         """
-        self.object.data.dof.focus_distance = self.focuses[key][0]  # type: ignore
-        self.object.data.dof.aperture_fstop = self.focuses[key][1]  # type: ignore
+        dof = self.object.data.dof  # type: ignore
+        dof.focus_distance, dof.aperture_fstop = self.focuses[key]
         logger.debug(f"Changed focus of {self.object.name} to '{key}' position.")
 
-    def frame_selected(self, object: bpy.types.Object) -> None:
+    def frame_selected(self, object: bpy.types.Object, objects: Optional[List[bpy.types.Object]] = None) -> None:
         """
         Align selected camera to frame all rendered objects.
+        Camera is fitted to world space bounding box corners of each rendered object, keeping its orientation.
         Applies zoom out afterwards (zoom_out < 1 - zoom in, zoom_out > 1 - zoom out).
+        Already resolved list of `object` and its children can be passed as `objects` to skip selecting them.
         """
         self.object.data.sensor_width = self._sensor_default  # type: ignore
-        cu.select_all(object)
+        selected = objects if objects is not None else cu.select_all(object)
         bpy.context.scene.camera = self.object
-        bpy.ops.view3d.camera_to_view_selected()
-        bpy.ops.object.select_all(action="DESELECT")
+        cu.update_depsgraph()
+        coords = get_vertices(selected).ravel().tolist()
+        location, _ = self.object.camera_fit_coords(bpy.context.evaluated_depsgraph_get(), coords)  # type: ignore
+        # fitted location is in world space, apply it through world matrix to respect parent and delta transforms
+        matrix_world = self.object.matrix_world.copy()
+        matrix_world.translation = location
+        self.object.matrix_world = matrix_world
+        if objects is None:
+            for obj in selected:
+                obj.select_set(False)
         self.object.data.sensor_width = self._sensor_zoomedout  # type: ignore
 
         cu.update_depsgraph()
 
         logger.debug(f"frame_selected function used for {self.object.name}")
 
-    def set_focus(self, object: bpy.types.Object) -> None:
+    def set_focus(self, target: Bounds) -> None:
         """
-        Calculate focus distance based on the distance between camera and rendered object.
-        Apply focal ratio.
+        Calculate focus distance based on the distance between camera and center of rendered object's bounds.
+        Apply focal ratio. Skipped if depth of field is disabled for the camera, as focus doesn't affect render then.
         """
-        cu.set_origin(object)
-        self.object.data.dof.focus_distance = abs((object.location - self.object.location).length)  # type: ignore
+        dof = self.object.data.dof  # type: ignore
+        if not dof.use_dof:
+            return
+        dof.focus_distance = abs((target.center - self.object.location).length)
         cfg_f_ratio = config.blendcfg["SCENE"]["FOCAL_RATIO"]
-        self.object.data.dof.aperture_fstop = (  # type: ignore
-            self._calculate_focal_ratio() if cfg_f_ratio == "auto" else cfg_f_ratio
-        )
+        dof.aperture_fstop = self._calculate_focal_ratio() if cfg_f_ratio == "auto" else cfg_f_ratio
         logger.debug(f"set_focus function used for {self.object.name}")
 
     def _calculate_focal_ratio(self) -> float:
@@ -182,8 +210,8 @@ class Camera:
         """
         Align camera to all rendered objects and then recalculate focus distance.
         """
-        self.frame_selected(object)
-        self.set_focus(target.bounds)
+        self.frame_selected(object, target.objects)
+        self.set_focus(target)
 
     def add_keyframe(
         self,
@@ -197,13 +225,15 @@ class Camera:
         Keyframe is added at specified frame.
         """
         if translations:
-            self.object.keyframe_insert(data_path="rotation_euler", frame=frame)
-            self.object.keyframe_insert(data_path="location", frame=frame)
+            object_keyframe_insert = self.object.keyframe_insert
+            object_keyframe_insert(data_path="rotation_euler", frame=frame)
+            object_keyframe_insert(data_path="location", frame=frame)
         if zoom_out:
             self.object.data.keyframe_insert(data_path="sensor_width", frame=frame)
         if focus:
-            self.object.data.dof.keyframe_insert(data_path="focus_distance", frame=frame)  # type: ignore
-            self.object.data.dof.keyframe_insert(data_path="aperture_fstop", frame=frame)  # type: ignore
+            dof_keyframe_insert = self.object.data.dof.keyframe_insert  # type: ignore
+            dof_keyframe_insert(data_path="focus_distance", frame=frame)
+            dof_keyframe_insert(data_path="aperture_fstop", frame=frame)
 
     def add_intermediate_keyframe(
         self,
@@ -213,32 +243,33 @@ class Camera:
         focus: bool = False,
         zoom_out: float = 1.0,
         frame_selected: bool = True,
+        set_frame: bool = True,
     ) -> None:
         """
         Insert intermediate keyframes for the camera at a specified fraction of the animation timeline or frame, aligning it with the rendered object.
         This ensures the object remains within the camera frame during interpolated movement. The method also allows optional adjustment of the
         camera's position by applying a zoom factor.
+        Pass `set_frame=False` only if the scene was already set to the `frame` by the caller.
         """
         scene = bpy.context.scene
         if progress is not None and frame is not None:
             raise ValueError("Only one of 'progress' or 'frame' should be provided, not both.")
         if progress is None and frame is None:
             raise ValueError("Either 'frame' or 'progress' value must be provided.")
-        scene.frame_set(int(scene.frame_end * progress) if progress is not None else frame)
+        if set_frame:
+            scene.frame_set(int(scene.frame_end * progress) if progress is not None else frame)
 
         if not self.custom:
             if frame_selected:
                 self.frame_selected(rendered_obj)
             self.object.data.sensor_width = self._sensor_zoomedout * zoom_out  # type: ignore
 
-        if config.blendcfg["SCENE"]["ORTHO_CAM"] or focus:
+        focus = config.blendcfg["SCENE"]["ORTHO_CAM"] or focus
+        if focus:
             with Bounds(cu.select_all(rendered_obj)) as target:
-                self.set_focus(target.bounds)
+                self.set_focus(target)
 
-        self.add_keyframe(
-            scene.frame_current,
-            focus=config.blendcfg["SCENE"]["ORTHO_CAM"] or focus,
-        )
+        self.add_keyframe(scene.frame_current, focus=focus)
 
     @contextmanager
     def dof_override(self) -> Generator[None, Any, None]:
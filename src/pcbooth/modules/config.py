@@ -87,20 +87,20 @@ def configure_paths(arguments: argparse.Namespace) -> None:
     global pcb_blend_path
     global PCB_name
 
+    settings = blendcfg["SETTINGS"]
     env_texture_path = pcbt_dir_path + "/templates/studio_small_08_4k.exr"
     backgrounds_path = pcbt_dir_path + "/templates/backgrounds/"
-    renders_path = prj_path + blendcfg["SETTINGS"]["RENDER_DIR"] + "/"
-    animations_path = prj_path + blendcfg["SETTINGS"]["ANIMATION_DIR"] + "/"
+    renders_path = prj_path + settings["RENDER_DIR"] + "/"
+    animations_path = prj_path + settings["ANIMATION_DIR"] + "/"
 
     # Determine blend_path
     if arguments.blend_path is None:
-        project_extension = blendcfg["SETTINGS"]["PRJ_EXTENSION"]
-        fab_path = prj_path + blendcfg["SETTINGS"]["FAB_DIR"] + "/"
+        fab_path = prj_path + settings["FAB_DIR"] + "/"
         if not path.isdir(fab_path):
             raise RuntimeError(
-                f"There is no {blendcfg['SETTINGS']['FAB_DIR']}/ directory in the current working directory! ({prj_path})"
+                f"There is no {settings['FAB_DIR']}/ directory in the current working directory! ({prj_path})"
             )
-        PCB_name = fio.read_pcb_name_from_prj(prj_path, project_extension)
+        PCB_name = fio.read_pcb_name_from_prj(prj_path, settings["PRJ_EXTENSION"])
         pcb_blend_path = fab_path + PCB_name + ".blend"
     else:
         PCB_name = arguments.blend_path.split("/")[-1].replace(".blend", "")
@@ -1,16 +1,20 @@
 """Module containing custom utilities functions."""
 
 import bpy
-from mathutils import Matrix
+import numpy as np
+from mathutils import Matrix, Vector
 from math import radians
 import logging
-from typing import List, Optional, Any, Dict, cast
+from typing import List, Optional, Tuple, cast
 import re
+import io
 from pcbooth.modules.bounding_box import Bounds
-from treelib import Tree  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+HORIZONTAL_ROTATION = Matrix.Rotation(radians(-90), 4, "Z")
+DESIGNATOR_PATTERN = re.compile(r"([A-Z]+\d+)")
+
 
 def save_pcb_blend(path: str, apply_transforms: bool = False) -> None:
     """Save the current model at the specified path."""
@@ -35,10 +39,35 @@ def open_blendfile(blendfile: str) -> None:
 
 
 def apply_all_transforms(object: bpy.types.Object) -> None:
-    """Apply all translations to specified object"""
-    object.select_set(True)
-    bpy.ops.object.transform_apply()
-    object.select_set(False)
+    """
+    Apply all translations to specified object.
+    Object data is transformed directly and children keep their world transforms.
+    """
+    if object.library or (object.data is not None and object.data.library):
+        logger.debug(f"Can't apply transforms to linked object: {object.name}")
+        return
+    if object.data is not None and object.data.users > 1:
+        logger.warning(f"Can't apply transforms to object with multi-user data: {object.name}")
+        return
+    basis = object.matrix_basis.copy()
+    if object.data is not None:
+        if not hasattr(object.data, "transform"):
+            logger.debug(f"Can't apply transforms to {object.type} object: {object.name}")
+            return
+        _transform_data(object, basis)
+    elif object.type == "EMPTY":
+        object.empty_display_size *= max(abs(scale) for scale in basis.to_scale())
+    for child in object.children:
+        child.matrix_parent_inverse = basis @ child.matrix_parent_inverse
+    object.matrix_basis = Matrix.Identity(4)
+
+
+def _transform_data(object: bpy.types.Object, matrix: Matrix) -> None:
+    """Transform object data in place using 4x4 matrix. Mesh shape keys are transformed along with the geometry."""
+    if isinstance(object.data, bpy.types.Mesh):
+        object.data.transform(matrix, shape_keys=True)
+    else:
+        object.data.transform(matrix)  # type: ignore
 
 
 def center_on_scene(object: bpy.types.Object) -> None:
@@ -46,11 +75,8 @@ def center_on_scene(object: bpy.types.Object) -> None:
     Move object's origin point to its geometric center and move the object to point (0,0,0) on scene.
     This is needed for nice animations when object is being rotated about the origin point.
     """
-    object.select_set(True)
-    bpy.context.view_layer.objects.active = object
-    bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
+    set_origin(object)
     object.location = (0.0, 0.0, 0.0)
-    bpy.ops.object.select_all(action="DESELECT")
     apply_all_transforms(object)
 
 
@@ -59,7 +85,6 @@ def rotate_horizontally(object: bpy.types.Object) -> None:
     Apply rotation based on PCB dimensions to rotate it horizontally.
     Rotation is applied around center of a scene (0,0,0) point.
     """
-    rotation_matrix = Matrix.Rotation(radians(-90), 4, "Z")
     if object.dimensions.x < object.dimensions.y:
         logger.info("Rotating the PCB horizontally.")
         object.rotation_euler = [0, 0, radians(-90)]
@@ -68,7 +93,7 @@ def rotate_horizontally(object: bpy.types.Object) -> None:
         # rotate camera_custom object if present
         if custom_camera := bpy.data.objects.get("camera_custom"):
             logger.info("Rotating 'camera_custom' accordingly")
-            custom_camera.matrix_world = rotation_matrix @ custom_camera.matrix_world
+            custom_camera.matrix_world = HORIZONTAL_ROTATION @ custom_camera.matrix_world
 
 
 def apply_display_rot(object: bpy.types.Object, display_rot: int) -> None:
@@ -87,13 +112,23 @@ def update_depsgraph() -> None:
     bpy.context.view_layer.update()  # type: ignore
 
 
+def deselect_all() -> None:
+    """Deselect currently selected objects only, without a select_all operator pass over the view layer."""
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+
+
 def select_all(parent_obj: bpy.types.Object) -> List[bpy.types.Object]:
     """Select parent object and all children recursively"""
     bpy.context.view_layer.objects.active = parent_obj
-    bpy.ops.object.select_all(action="DESELECT")
-    bpy.ops.object.select_grouped(extend=True, type="CHILDREN_RECURSIVE")
-    parent_obj.select_set(True)
-    return bpy.context.selected_objects
+    deselect_all()
+    # only children selectable in the view layer, same as select_grouped operator
+    selected = [parent_obj] + [
+        child for child in parent_obj.children_recursive if child.visible_get() and not child.hide_select
+    ]
+    for obj in selected:
+        obj.select_set(True)
+    return selected
 
 
 def get_top_parent(object: bpy.types.Object) -> bpy.types.Object:
@@ -119,7 +154,9 @@ def parent_list_to_object(
     skip_lights: bool = True,
     skip_cameras: bool = True,
 ) -> None:
-    """Parent all objects in a list to another object."""
+    """Parent all objects in a list to another object, keeping their world transforms."""
+    update_depsgraph()
+    parent_inverse = parent.matrix_world.inverted()
     for obj in child_objs:
         if obj.parent is not None:
             continue
@@ -130,20 +167,21 @@ def parent_list_to_object(
         if obj.library:
             continue
 
-        # set parent for all child objects
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        parent.select_set(True)
-        bpy.context.view_layer.objects.active = parent  # active obj will be parent
-        bpy.ops.object.parent_set(keep_transform=True)
-        bpy.ops.object.select_all(action="DESELECT")
+        # unparented object's world transform is its basis, compensate for parent's world transform
+        obj.parent = parent
+        obj.matrix_parent_inverse = parent_inverse
 
 
 def link_obj_to_collection(obj: bpy.types.Object, target_coll: bpy.types.Collection) -> None:
     """Loop through all collections the obj is linked to and unlink it from there, then link to target collection."""
+    linked = False
     for coll in obj.users_collection:  # type: ignore
+        if coll == target_coll:
+            linked = True
+            continue
         coll.objects.unlink(obj)
-    target_coll.objects.link(obj)
+    if not linked:
+        target_coll.objects.link(obj)
 
 
 def get_collection(name: str, parent: Optional[bpy.types.Collection] = None) -> bpy.types.Collection:
@@ -162,11 +200,7 @@ def get_collection(name: str, parent: Optional[bpy.types.Collection] = None) ->
 
 def hex_to_rgb(hex_number: str) -> tuple[float, ...]:
     """Convert hex number to RGBA."""
-    rgb = []
-    for i in (0, 2, 4):
-        decimal = int(hex_number[i : i + 2], 16)
-        rgb.append(decimal / 255)
-    return tuple(rgb)
+    return tuple(channel / 255 for channel in bytes.fromhex(hex_number[:6]))
 
 
 def add_empty(
@@ -181,27 +215,46 @@ def add_empty(
     Empty object is placed in the center point of `origin_source` objects bounding box ([0,0,0] point is used if both `origin_source` and `children` are empty).
     """
     object = bpy.data.objects.new(name, None)
-    if target_coll:
-        link_obj_to_collection(object, target_coll)
-    else:
-        bpy.context.scene.collection.objects.link(object)
+    if not target_coll:
+        target_coll = bpy.context.scene.collection
+    target_coll.objects.link(object)
 
     if children:
         if not origin_source:
             origin_source = children
         with Bounds(children) as target:
-            set_origin(target.bounds)
-            object.location = target.bounds.location.copy()
+            object.location = target.center
         parent_list_to_object(children, object)
     return object
 
 
 def set_origin(object: bpy.types.Object) -> None:
-    bpy.ops.object.select_all(action="DESELECT")
-    object.select_set(True)
-    bpy.context.view_layer.objects.active = object
-    bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
-    bpy.ops.object.select_all(action="DESELECT")
+    """
+    Move object's origin point to the center of its geometry bounding box.
+    Geometry and children stay in place. Objects without geometry are left unchanged.
+    """
+    if object.data is None or not hasattr(object.data, "transform"):
+        return
+    if object.library or object.data.library:
+        logger.debug(f"Can't set origin of linked object: {object.name}")
+        return
+    if object.data.users > 1:
+        logger.warning(f"Can't set origin of object with multi-user data: {object.name}")
+        return
+    if isinstance(object.data, bpy.types.Mesh):
+        if not object.data.vertices:
+            return
+        coords = np.empty(len(object.data.vertices) * 3, dtype=np.float64)
+        object.data.vertices.foreach_get("co", coords)
+        points = coords.reshape(-1, 3)
+    else:
+        points = np.asarray(object.bound_box, dtype=np.float64)  # type: ignore
+    center = Vector(((points.min(axis=0) + points.max(axis=0)) / 2).tolist())
+
+    _transform_data(object, Matrix.Translation(-center))
+    object.matrix_basis = object.matrix_basis @ Matrix.Translation(center)
+    for child in object.children:
+        child.matrix_parent_inverse = Matrix.Translation(-center) @ child.matrix_parent_inverse
 
 
 def get_linked() -> List[bpy.types.Object]:
@@ -218,8 +271,7 @@ def get_designator(object: bpy.types.Object) -> str:
     Extract designator part out of object's name using regex.
     Expects <DES><idx>:<component value> string as object name.
     """
-    regexp = r"^([A-Z]+\d+)\:*"
-    result = re.search(regexp, object.name)
+    result = DESIGNATOR_PATTERN.match(object.name)
     if result:
         return result.group(1)
     return ""
@@ -233,41 +285,35 @@ def print_hierarchy() -> None:
     col = "🗀"
     link = " [\x1b[3mlinked\x1b[0m]"
 
-    def _get_struct(item: bpy.types.Collection) -> Dict[str, Any]:
-        """Get Blender outliner hierarchy as a dict."""
+    def _get_tag(item: bpy.types.Collection | bpy.types.Object) -> str:
+        """Get hierarchy line text of a collection or object."""
         if isinstance(item, bpy.types.Collection):
-            struct: Dict[str, Any] = {}
-            collection_key = f"{col}  {item.name}"
-            struct[collection_key] = {}
-
-            for obj in item.objects:
-                obj_key = f"{obj_map.get(obj.type, '?')}  {obj.name}{link if obj.instance_type == 'COLLECTION' else ''}"
-                struct[collection_key][obj_key] = None
-
-            for child_collection in item.children:
-                struct[collection_key].update(_get_struct(child_collection))
-
-            return struct
-        return {}
-
-    def _make_tree(tree: Tree, data: Dict[str, Any], parent: Optional[str] = None) -> None:
-        """Create treelib Tree."""
-        for key, value in data.items():
-            tree.create_node(key, key, parent=parent)
-            if isinstance(value, dict):
-                _make_tree(tree, value, key)
+            return f"{col}  {item.name}"
+        return f"{obj_map.get(item.type, '?')}  {item.name}{link if item.instance_type == 'COLLECTION' else ''}"
 
     logger.info(f"Legend: {obj_map}")
     root_col = bpy.context.view_layer.layer_collection.collection
-    struct = _get_struct(root_col)
-    tree = Tree()
-    _make_tree(tree, struct)
-    logger.info("\n" + str(tree))
+    output = io.StringIO()
+    # (item, tag, line prefix, indent of item's children), siblings are printed sorted by tag
+    stack: List[Tuple[bpy.types.Collection | bpy.types.Object, str, str, str]] = [
+        (root_col, _get_tag(root_col), "", "")
+    ]
+    while stack:
+        item, tag, branch, indent = stack.pop()
+        output.write(f"{branch}{tag}\n")
+        if not isinstance(item, bpy.types.Collection):
+            continue
+        children = sorted(((_get_tag(child), child) for child in (*item.objects, *item.children)), key=lambda c: c[0])
+        for index, (child_tag, child) in reversed(list(enumerate(children))):
+            last = index == len(children) - 1
+            child_branch, child_indent = ("└── ", "    ") if last else ("├── ", "│   ")
+            stack.append((child, child_tag, indent + child_branch, indent + child_indent))
+    logger.info("\n" + output.getvalue())
 
 
 def anim_to_deltas(obj: bpy.types.Object) -> None:
     """Transform objects LocRotScale animations to delta animations."""
-    bpy.ops.object.select_all(action="DESELECT")
+    deselect_all()
     obj.select_set(True)
     bpy.ops.object.anim_transforms_to_deltas()
     obj.select_set(False)
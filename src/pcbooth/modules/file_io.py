@@ -6,8 +6,10 @@ import os
 import sys
 from pathlib import Path
 from contextlib import contextmanager
-from subprocess import run, DEVNULL, PIPE, CalledProcessError
-from typing import Generator, Optional, List, Callable, Literal, Any
+from functools import lru_cache
+from subprocess import Popen, DEVNULL, PIPE, STDOUT
+from typing import Generator, Optional, List, Tuple, Callable, Literal, Any, Deque
+from collections import deque
 from io import TextIOWrapper
 
 import pcbooth.modules.config as config
@@ -23,28 +25,34 @@ def read_pcb_name_from_prj(path: str, extension: str) -> str:
     This function will fail and throw a `RuntimeError` if `path` is
     not a valid project directory.
     """
-    files = os.listdir(path)
-    project_file = [f for f in files if f.endswith(extension)]
+    project_file = list(Path(path).glob(f"*{extension}"))
 
     if len(project_file) != 1:
         logger.error(f"There should be only one {extension} file in project main directory!")
-        logger.error("Found: " + repr(project_file))
+        logger.error("Found: " + repr([file.name for file in project_file]))
         raise RuntimeError(f"Expected single {extension} file in current directory, got %d" % len(project_file))
 
-    name = Path(project_file[0]).stem
+    name = project_file[0].stem
     logger.debug("PCB name: %s", name)
     return name
 
 
+@lru_cache(maxsize=32)
+def _load_blend_names(blendfile: str, data_type: str) -> Tuple[str, ...]:
+    """Read names of data stored in Blender file, cached so each file and data type is opened only once."""
+    with bpy.data.libraries.load(blendfile) as (data_from, data_to):
+        return tuple(getattr(data_from, data_type))
+
+
 def get_data_from_blendfile(
-    blendfile: str, data_type: str, filter_func: Callable[[str], bool] = lambda x: True
+    blendfile: str, data_type: str, filter_func: Optional[Callable[[str], bool]] = None
 ) -> Optional[List[str]]:
     """List data from another Blender file without including it in current file."""
     result = None
     try:
-        with bpy.data.libraries.load(blendfile) as (data_from, data_to):
-            result = list(filter(filter_func, getattr(data_from, data_type)))
-            logger.debug("Found data " + data_type + " in file " + blendfile)
+        names = _load_blend_names(blendfile, data_type)
+        result = list(names) if filter_func is None else [name for name in names if filter_func(name)]
+        logger.debug("Found data " + data_type + " in file " + blendfile)
     except Exception:
         logger.error("Failed to open blend file " + blendfile)
     return result
@@ -53,24 +61,22 @@ def get_data_from_blendfile(
 def link_collection_from_blendfile(blendfile: str, collection_name: str) -> bpy.types.Object | None:
     """
     Link collection data from another Blender file.
+    Linked collection is instanced using an empty object added to the active collection.
     """
-    section = "/Collection/"
-    filepath = blendfile + section + collection_name
-    directory = blendfile + section
-    bpy.ops.wm.link(
-        filepath=filepath,  # full path to .blend with /Collection/collection name
-        directory=directory,  # full path to .blend with /Collection
-        filename=collection_name,  # collection name
-        active_collection=True,
-    )
-
-    # return last object that starts with collection_name (in case it got appended with index)
-    object = [obj for obj in bpy.data.objects if obj.name.startswith(collection_name) and not obj.library][-1]
-    if isinstance(object, bpy.types.Object):
-        logger.debug(f"Linked {collection_name} from {blendfile}")
-        return object
-    logger.debug(f"Failed to link {collection_name} from {blendfile}")
-    return None
+    with bpy.data.libraries.load(blendfile, link=True) as (data_from, data_to):
+        data_to.collections = [collection_name]
+
+    collection = data_to.collections[0]
+    if not isinstance(collection, bpy.types.Collection):
+        logger.debug(f"Failed to link {collection_name} from {blendfile}")
+        return None
+
+    object = bpy.data.objects.new(collection.name, None)
+    object.instance_type = "COLLECTION"
+    object.instance_collection = collection
+    bpy.context.collection.objects.link(object)
+    logger.debug(f"Linked {collection_name} from {blendfile}")
+    return object
 
 
 @contextmanager
@@ -125,19 +131,26 @@ def execute_cmd(
     cmd_list: List[str],
     stdout: bool = False,
     stderr: bool = False,
-    level: Literal["info", "debug", "warning", "error" "critical"] = "debug",
+    level: Literal["info", "debug", "warning", "error", "critical"] = "debug",
+    label: Optional[str] = None,
 ) -> None:
-    """Execute command using Subprocess module. stderr and stdout can be passed to logger with varying level."""
+    """
+    Execute command using Subprocess module. stderr and stdout can be passed to logger with varying level.
+    Output is logged line by line while the command runs, last lines are repeated as error if the command fails.
+    Logged lines are prefixed with `label` (command name by default) to tell apart commands running concurrently.
+    """
 
     stdout_val = PIPE if stdout else DEVNULL
-    stderr_val = PIPE if stderr else DEVNULL
-    try:
-        log = run(
-            cmd_list,
-            check=True,
-            text=True,
-            stdout=stdout_val,
-            stderr=stderr_val,
-        )
-    except CalledProcessError as err:
-        logger.error(err.stderr)
+    stderr_val = (STDOUT if stdout else PIPE) if stderr else DEVNULL
+    prefix = f"[{label or cmd_list[0]}]"
+    log = getattr(logger, level)
+    output: Deque[str] = deque(maxlen=20)
+    with Popen(cmd_list, text=True, bufsize=1, stdin=DEVNULL, stdout=stdout_val, stderr=stderr_val) as process:
+        if stream := process.stdout or process.stderr:
+            for line in stream:
+                output.append(line.rstrip())
+                log(f"{prefix} {output[-1]}")
+    if process.returncode:
+        logger.error(f"{prefix} Command '{cmd_list[0]}' returned non-zero exit status {process.returncode}.")
+        if output:
+            logger.error("\n".join(f"{prefix} {line}" for line in output))
@@ -12,6 +12,9 @@ from pcbooth.modules.bounding_box import Bounds
 
 logger = logging.getLogger(__name__)
 
+HDRI_ROTATION = (radians(-30), radians(0), radians(160))
+LIGHT_SPREAD = radians(140)
+
 
 def load_hdri() -> None:
     """Load HDRI environmental texture and setup it's World shader."""
@@ -27,7 +30,7 @@ def load_hdri() -> None:
     texture_coordinate = nodes.new(type="ShaderNodeTexCoord")
 
     mapping = nodes.new(type="ShaderNodeMapping")
-    mapping.inputs["Rotation"].default_value = (radians(-30), radians(0), radians(160))  # type: ignore
+    mapping.inputs["Rotation"].default_value = HDRI_ROTATION  # type: ignore
 
     hdri = nodes.new("ShaderNodeTexEnvironment")
     hdri.image = bpy.data.images.load(config.env_texture_path)  # type: ignore
@@ -99,6 +102,7 @@ def disable_emission_nodes() -> None:
 
 class Light:
     objects: ClassVar[List["Light"]] = []
+    _by_name: ClassVar[Dict[str, "Light"]] = {}
     collection: bpy.types.Collection
     presets: Dict[str, Tuple[Tuple[float, float, float], tuple[float, float, float], float]] = {
         "TOP": ((radians(0), radians(0), radians(0)), (0.0, 0.0, 0.0), 1.0),
@@ -120,9 +124,8 @@ class Light:
     @classmethod
     def get(cls, name: str) -> Optional["Light"]:
         """Get Camera object by name string."""
-        for object in cls.objects:
-            if object.name == name:
-                return object
+        if object := cls._by_name.get(name):
+            return object
         logger.warning(f"Light: {name} not found.")
         return None
 
@@ -130,25 +133,24 @@ class Light:
     def update(cls, obj: bpy.types.Object) -> None:
         """Update position and power of all lights based on highest point of rendered object and its dimensions."""
         with Bounds(cu.select_all(obj)) as target:
-            cu.set_origin(target.bounds)
-            obj_x = target.bounds.dimensions.x
-            obj_y = target.bounds.dimensions.y
+            obj_x = target.dimensions.x
+            obj_y = target.dimensions.y
             z_coord = calculate_z_coordinate(target.max_z, obj_x, obj_y)
-            offset = (target.bounds.location.x, target.bounds.location.y, z_coord)
+            offset = (target.center.x, target.center.y, z_coord)
+            dimensions = target.dimensions.to_tuple()
+            light_size = calculate_light_size(obj_x, obj_y)
+            lights_intensity = config.blendcfg["SCENE"]["LIGHTS_INTENSITY"]
             for lt in cls.objects:
-                pos_preset = cls.presets[lt.name][1]
-                intensity_preset = cls.presets[lt.name][2]
-                dimensions = target.bounds.dimensions.to_tuple()
+                _, pos_preset, intensity_preset = cls.presets[lt.name]
                 new_pos = tuple(pos * dim for pos, dim in zip(pos_preset, dimensions, strict=True))
                 lt.object.location = tuple(pos + offset for pos, offset in zip(new_pos, offset, strict=True))
                 logger.debug(f"Light `{lt.name}` moved to: {lt.object.location}")
 
-                config_intensity = config.blendcfg["SCENE"]["LIGHTS_INTENSITY"] * intensity_preset
-                lt.object.data.energy = calculate_light_intensity(config_intensity, obj_x, obj_y)  # type: ignore
+                light = lt.object.data
+                config_intensity = lights_intensity * intensity_preset
+                light.energy = calculate_light_intensity(config_intensity, obj_x, obj_y)  # type: ignore
 
-                light_size = calculate_light_size(obj_x, obj_y)
-                lt.object.data.size = light_size[0]  # type: ignore
-                lt.object.data.size_y = light_size[1]  # type: ignore
+                light.size, light.size_y = light_size  # type: ignore
         cu.update_depsgraph()
 
     @classmethod
@@ -159,11 +161,13 @@ class Light:
 
     def add_keyframe(self, frame: int) -> None:
         """Keyframe Light settings."""
-        self.object.keyframe_insert(data_path="rotation_euler", frame=frame)
-        self.object.keyframe_insert(data_path="location", frame=frame)
-        self.object.data.keyframe_insert(data_path="energy", frame=frame)  # type: ignore
-        self.object.data.keyframe_insert(data_path="size", frame=frame)  # type: ignore
-        self.object.data.keyframe_insert(data_path="size_y", frame=frame)  # type: ignore
+        object_keyframe_insert = self.object.keyframe_insert
+        data_keyframe_insert = self.object.data.keyframe_insert  # type: ignore
+        object_keyframe_insert(data_path="rotation_euler", frame=frame)
+        object_keyframe_insert(data_path="location", frame=frame)
+        data_keyframe_insert(data_path="energy", frame=frame)
+        data_keyframe_insert(data_path="size", frame=frame)
+        data_keyframe_insert(data_path="size_y", frame=frame)
 
     def __init__(
         self,
@@ -188,17 +192,18 @@ class Light:
         """Create light object."""
         light_name = "light_" + name.lower()
         light = bpy.data.lights.new(light_name, type="AREA")
-        light.spread = radians(140)  # type: ignore
+        light.spread = LIGHT_SPREAD  # type: ignore
         light.color = cu.hex_to_rgb(config.blendcfg["SCENE"]["LIGHTS_COLOR"])
         light.shape = "RECTANGLE"  # type: ignore
 
         object = bpy.data.objects.new(light_name, light)
         object.rotation_euler = rotation
         object.location = location
-        cu.link_obj_to_collection(object, Light.collection)
+        Light.collection.objects.link(object)
 
         cu.update_depsgraph()
         logger.debug(f"Added light object at: \n{object.matrix_world}")
         Light.objects.append(self)
+        Light._by_name.setdefault(name, self)
 
         return object
@@ -3,19 +3,22 @@
 import bpy
 import logging
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from pcbooth.modules.file_io import stdout_redirected, execute_cmd
 import pcbooth.modules.config as config
-from typing import Dict, List, Callable, Any, cast, Optional
+from typing import Dict, List, Callable, Any, cast, Optional, Self, Type
+from types import TracebackType
 from pcbooth.modules.file_io import remove_file, mkdir
 
-from re import match
-from os import listdir
+import re
+from os import scandir
 
 logger = logging.getLogger(__name__)
 
 CACHE_FORMAT = "PNG"
 CACHE_NAME = "_tmp_render"
+FRAME_PATTERN = re.compile(r"^.+_\d{4}..+$")
 
 
 def setup_ultralow_cycles() -> None:
@@ -132,32 +135,38 @@ def set_lqbw_compositing() -> None:
 def setup_gpu() -> None:
     """
     Find compatible GPU devices and enable them for rendering.
+    Backends are tried in order of preference (OptiX before CUDA for NVIDIA cards) and
+    all devices of the chosen backend are enabled, so multi-GPU hosts render on every card.
     If no suitable GPU is found, use CPU instead.
     """
     cycles_preferences = bpy.context.preferences.addons["cycles"].preferences
     cycles_preferences.refresh_devices()  # type: ignore
-    logger.debug(f"Available devices: {[device for device in cycles_preferences.devices]}")  # type: ignore
+    devices = list(cycles_preferences.devices)  # type: ignore
+    logger.debug(f"Available devices: {devices}")
     gpu_types = [
-        "CUDA",
         "OPTIX",
+        "CUDA",
         "HIP",
         "ONEAPI",
         "METAL",
     ]
 
-    try:
-        device = next((dev for dev in cycles_preferences.devices if dev.type in gpu_types))  # type: ignore
+    available_types = {dev.type for dev in devices}
+    device_type = next((gpu_type for gpu_type in gpu_types if gpu_type in available_types), None)
+    if device_type:
         bpy.context.scene.cycles.device = "GPU"
-        cycles_preferences.compute_device_type = device.type  # type: ignore
-        logger.info(f"Enabled GPU rendering with: {device.name}.")
-    except StopIteration:
+        cycles_preferences.compute_device_type = device_type  # type: ignore
+        enabled = [dev for dev in devices if dev.type == device_type]
+        logger.info(f"Enabled GPU rendering ({device_type}) with: {', '.join(dev.name for dev in enabled)}.")
+    else:
         if config.args.force_gpu:
             raise RuntimeError("GPU rendering enforced but no GPU device available, terminating.")
-        device = next((dev for dev in cycles_preferences.devices if dev.type == "CPU"), None)  # type: ignore
         bpy.context.scene.cycles.device = "CPU"
         cycles_preferences.compute_device_type = "NONE"  # type: ignore
-        logger.info(f"No GPU device found, enabled CPU rendering with: {device.name}")
-    device.use = True
+        enabled = [dev for dev in devices if dev.type == "CPU"]
+        logger.info(f"No GPU device found, enabled CPU rendering with: {', '.join(dev.name for dev in enabled)}")
+    for dev in devices:
+        dev.use = dev in enabled
 
 
 def init_render_settings() -> None:
@@ -190,6 +199,8 @@ class RendererWrapper:
         self.cache_path: str
         self.tmb_x = config.blendcfg["RENDERER"]["THUMBNAIL_WIDTH"]
         self.tmb_y = config.blendcfg["RENDERER"]["THUMBNAIL_HEIGHT"]
+        self.thumbnails: bool = config.blendcfg["SETTINGS"]["THUMBNAILS"]
+        self.keep_frames: bool = config.blendcfg["SETTINGS"]["KEEP_FRAMES"]
         self.render_path: str = config.renders_path
 
     def _set_image_format(self, format: str) -> None:
@@ -274,7 +285,7 @@ class RendererWrapper:
         Make thumbnail copy of a rendered image. Uses previously saved render image data.
         Uses cached render from _init_render method.
         """
-        if not config.blendcfg["SETTINGS"]["THUMBNAILS"]:
+        if not self.thumbnails:
             return
         if not self.cache:
             logger.info(f"Rendering {file_name}...")
@@ -298,21 +309,27 @@ class RendererWrapper:
     def render_animation(self, camera: bpy.types.Object, file_name: str) -> None:
         """
         Render sequence of images iterating over frame count range from bpy.context.scene.
-        Clears cache after each frame as they are not supposed to be rendered as mutliple format.
+        Frames are written by the renderer straight to their final file names, skipping the
+        render cache as they are not supposed to be saved in multiple formats.
         """
         scene = bpy.context.scene
+        scene.camera = camera
+        self._set_image_format(CACHE_FORMAT)
+        frame_path = self.render_path + file_name
+        frame_set = scene.frame_set
         for frame in range(scene.frame_start, scene.frame_end + 1):
-            frame_name = f"{file_name}_{frame:04}"
-            scene.frame_set(frame)
-            self.render(camera, frame_name, CACHE_FORMAT)
-            self.clear_cache()
+            frame_set(frame)
+            scene.render.filepath = f"{frame_path}_{frame:04}"
+            with stdout_redirected():
+                bpy.ops.render.render(write_still=True)
+            logger.info(f"Saved render as: {bpy.path.relpath(scene.render.filepath + self.img_ext)}")
 
     def clear_cache(self) -> None:
         """
         Remove render cache file. Looks for CACHE_NAME files. Sets cache attribute to None.
         """
         logger.debug("Removing cached render.")
-        if not config.blendcfg["SETTINGS"]["KEEP_FRAMES"]:
+        if not self.keep_frames:
             remove_file(self.cache_path)
         self.cache = None
 
@@ -326,6 +343,8 @@ class FFmpegWrapper:
             "-c:v": "libvpx-vp9",
             "-pix_fmt": "yuva420p",
             "-b:v": "5M",
+            "-threads": "0",
+            "-row-mt": "1",
         },
         "MP4": {
             "-c:v": "libx264",
@@ -348,82 +367,124 @@ class FFmpegWrapper:
 
     def __init__(self) -> None:
         self.formats = config.blendcfg["SETTINGS"]["VIDEO_FORMAT"]
-        self.format: str
-        self.vid_ext: str
         self.img_ext = bpy.context.scene.render.file_extension
         self.res_x = config.blendcfg["RENDERER"]["VIDEO_WIDTH"]
         self.res_y = config.blendcfg["RENDERER"]["VIDEO_HEIGHT"]
         self.tmb_x = config.blendcfg["RENDERER"]["THUMBNAIL_WIDTH"]
         self.tmb_y = config.blendcfg["RENDERER"]["THUMBNAIL_HEIGHT"]
         self.fps = config.blendcfg["RENDERER"]["FPS"]
+        self.thumbnails: bool = config.blendcfg["SETTINGS"]["THUMBNAILS"]
+        self.keep_frames: bool = config.blendcfg["SETTINGS"]["KEEP_FRAMES"]
         self.animation_path = config.animations_path
         self.render_path = config.renders_path
         self.start_frame = bpy.context.scene.frame_start
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: List[Future[None]] = []
+
+    def __enter__(self) -> Self:
+        """Return FFmpegWrapper object."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Shut down sequencing thread. Queued tasks are cancelled if exiting due to an error."""
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
 
-    def _set_video_format(self, format: str) -> None:
-        """Set sequencer video output format and file extension."""
-        self.format = format
-        self.vid_ext = f".{self.format.lower()}"
+    @staticmethod
+    def _get_video_ext(format: str) -> str:
+        """Get video file extension matching sequencer output format."""
+        return f".{format.lower()}"
+
+    def submit(self, input_file: str, reversed_file: str) -> None:
+        """
+        Queue sequencing of rendered frames into an animation, its reversed copy and their thumbnails.
+        Encoding runs in a background thread so that the next animation can be rendered in the meantime.
+        Call wait() (done by clear_frames()) before the frames are removed.
+        """
+        self._pending.append(self._executor.submit(self._encode, input_file, reversed_file))
+
+    def _encode(self, input_file: str, reversed_file: str) -> None:
+        """
+        Sequence animation and all of its derived videos.
+        Reversed video and thumbnail of the forward video only depend on the forward video,
+        so they are encoded concurrently.
+        """
+        self.run(input_file, input_file)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reverse_task = executor.submit(self.reverse, input_file, reversed_file)
+            thumbnail_task = executor.submit(self.thumbnail, input_file)
+            reverse_task.result()
+            executor.submit(self.thumbnail, reversed_file).result()
+            thumbnail_task.result()
+
+    def wait(self) -> None:
+        """Block until all queued sequencing tasks are finished, re-raise their errors."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
 
     def run(self, input_file: str, output_file: str) -> None:
         """Run FFPMEG and sequence images into full-scale animation."""
         for format in self.formats:
-            self._set_video_format(format)
             input_dict = {
                 "-framerate": str(self.fps),
                 "-start_number": str(self.start_frame),
                 "-i": f"{self.render_path}{input_file}_%04d.png",
                 "-s": f"{self.res_x}x{self.res_y}",
             }
-            self._sequence(input_dict, output_file)
+            self._sequence(input_dict, output_file, format)
 
     def reverse(self, input_file: str, output_file: str) -> None:
         """Reverse existing video file."""
         for format in self.formats:
-            self._set_video_format(format)
-            decoder = FFmpegWrapper.FORMAT_ARGUMENTS[self.format]
+            decoder = FFmpegWrapper.FORMAT_ARGUMENTS[format]
             input_dict = {
                 **({"-c:v": str(decoder)} if decoder else {}),
-                "-i": f"{self.animation_path}{input_file}{self.vid_ext}",
+                "-i": f"{self.animation_path}{input_file}{self._get_video_ext(format)}",
                 "-vf": "reverse",
             }
-            self._sequence(input_dict, output_file)
+            self._sequence(input_dict, output_file, format)
 
     def thumbnail(self, input_file: str, output_file: Optional[str] = None) -> None:
         """Scale existing video file down into thumbnail."""
-        if not config.blendcfg["SETTINGS"]["THUMBNAILS"]:
+        if not self.thumbnails:
             return
         if not output_file:
             output_file = input_file
         for format in self.formats:
-            self._set_video_format(format)
-            decoder = FFmpegWrapper.FORMAT_ARGUMENTS[self.format]
+            decoder = FFmpegWrapper.FORMAT_ARGUMENTS[format]
             input_dict = {
                 **({"-c:v": str(decoder)} if decoder else {}),
-                "-i": f"{self.animation_path}{input_file}{self.vid_ext}",
+                "-i": f"{self.animation_path}{input_file}{self._get_video_ext(format)}",
                 "-vf": f"scale={self.tmb_x}:{self.tmb_y}",
             }
-            self._sequence(input_dict, output_file, suffix="_thumbnail")
+            self._sequence(input_dict, output_file, format, suffix="_thumbnail")
 
     def _sequence(
         self,
         input_dict: Dict[str, str],
         output_file: str,
+        format: str,
         suffix: str = "",
     ) -> None:
         """Execute FFMPEG command."""
 
-        preset_dict = FFmpegWrapper.FORMAT_ARGUMENTS[self.format]
-        full_output_file = Path(f"{self.animation_path}{output_file}{suffix}{self.vid_ext}")
+        preset_dict = FFmpegWrapper.FORMAT_ARGUMENTS[format]
+        full_output_file = Path(f"{self.animation_path}{output_file}{suffix}{self._get_video_ext(format)}")
 
         mkdir(str(full_output_file.parent))
         cmd = self._get_cmd(input_dict | preset_dict, full_output_file)
-        execute_cmd(cmd, stdout=True, stderr=True)
+        execute_cmd(cmd, stdout=True, stderr=True, label=f"ffmpeg {full_output_file}")
         logger.info(f"Sequenced (FFMPEG): {full_output_file}")
 
     def _get_cmd(self, cmd_dict: Dict[str, str], output_file: str | Path) -> List[str]:
         """Prepare list of FFMPEG arguments from dictionary for subprocess library."""
-        return ["ffmpeg"] + [item for pair in cmd_dict.items() for item in pair] + [str(output_file)] + ["-y"]
+        arguments = [item for pair in cmd_dict.items() for item in pair]
+        return ["ffmpeg", "-nostats"] + arguments + [str(output_file)] + ["-y"]
 
     def clear_frames(self) -> None:
         """
@@ -431,13 +492,14 @@ class FFmpegWrapper:
         Recognizes <filename>_<frame_number>.<ext> filenames using regex.
         Expects 4-digit frame number.
         """
+        self.wait()
         logger.debug("Removing frames.")
-        pattern = r"^.+_\d{4}..+$"
-        if config.blendcfg["SETTINGS"]["KEEP_FRAMES"]:
+        if self.keep_frames:
             return
         try:
-            for file in listdir(self.render_path):
-                if match(pattern, file):
-                    remove_file(self.render_path + file)
+            with scandir(self.render_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and FRAME_PATTERN.match(entry.name):
+                        remove_file(entry.path)
         except FileNotFoundError:
             logger.debug("No frames found to remove.")
@@ -5,7 +5,7 @@ Adds cameras, lights and backgrounds.
 
 import bpy
 from math import radians
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Callable
 import logging
 
 import pcbooth.modules.config as config
@@ -92,8 +92,9 @@ class Studio:
         self.cameras = [cam for cam in Camera.objects if cam.name in cfg_cameras]
         self.positions = [pos for pos in Studio.presets if pos in cfg_pos]
         self.change_position("TOP")
-        for camera in Camera.objects:
-            camera.change_position("TOP")
+        with Camera.deferred_updates():
+            for camera in Camera.objects:
+                camera.change_position("TOP")
 
     def _add_backgrounds(self) -> None:
         Background.add_collection()
@@ -147,21 +148,15 @@ class Studio:
         """Assign configurational attributes' values based on loaded model contents."""
         logger.info("Configuring studio...")
 
-        obj_type, rendered_obj_name = "", ""
-        if config.blendcfg["SCENE"]["RENDERED_OBJECT"]:
-            obj_type = config.blendcfg["SCENE"]["RENDERED_OBJECT"][0]
-            rendered_obj_name = config.blendcfg["SCENE"]["RENDERED_OBJECT"][1]
-
-        # single object picked using RENDERED_OBJECT setting
-        if obj_type == "Object":
-            logger.info(f"Rendering from object: {rendered_obj_name}")
-            self._configure_as_singleobject(rendered_obj_name)
-            return
-
-        # single collection picked using RENDERED_OBJECT setting
-        if obj_type == "Collection":
-            logger.info(f"Rendering from collection: {rendered_obj_name}")
-            self._configure_as_collection(rendered_obj_name)
+        # single object or collection picked using RENDERED_OBJECT setting
+        handlers: Dict[str, Callable[[str], None]] = {
+            "Object": self._configure_as_singleobject,
+            "Collection": self._configure_as_collection,
+        }
+        obj_type, rendered_obj_name = config.blendcfg["SCENE"]["RENDERED_OBJECT"] or ("", "")
+        if configure := handlers.get(obj_type):
+            logger.info(f"Rendering from {obj_type.lower()}: {rendered_obj_name}")
+            configure(rendered_obj_name)
             return
 
         # PCB generated using gerber2blend
@@ -194,8 +189,8 @@ class Studio:
         rendered_col = bpy.data.collections.get(collection_name)
         if not rendered_col:
             raise RuntimeError(f"{collection_name} collection could not be found in Blender model data.")
-        scene_components = [object for object in bpy.data.objects]
-        rendered_components = [object for object in rendered_col.objects]
+        scene_components = list(bpy.data.objects)
+        rendered_components = list(rendered_col.objects)
         self._get_top_bottom_components(rendered_components)
         self.rendered_obj = cu.add_empty("_rendered_parent", children=rendered_components)
         self.top_parent = cu.add_empty("_parent", children=scene_components, origin_source=rendered_components)
@@ -206,13 +201,13 @@ class Studio:
         self.rendered_obj = bpy.data.objects.get(object_name)
         if not self.rendered_obj:
             raise RuntimeError(f"{object_name} object could not be found in Blender model data.")
-        scene_components = [object for object in bpy.data.objects]
+        scene_components = list(bpy.data.objects)
         self._get_top_bottom_components(scene_components)
         self.top_parent = cu.add_empty("_parent", children=scene_components, origin_source=[self.rendered_obj])
         cu.set_origin(self.rendered_obj)  # needed to correctly calculate focus
 
     def _configure_as_unknown(self) -> None:
-        scene_components = [object for object in bpy.data.objects]
+        scene_components = list(bpy.data.objects)
         self.top_parent = cu.add_empty("_parent", children=scene_components)
         self.rendered_obj = self.top_parent
         self._get_top_bottom_components(scene_components)
@@ -241,21 +236,18 @@ class Studio:
         This custom property is saved in objects when they're imported using picknblend tool.
         If `enable_all` argument is set to true, all available components passed to function will be added to both of the lists.
         """
-        top_comps = []
-        bot_comps = []
+        top_comps: List[bpy.types.Object] = []
+        bot_comps: List[bpy.types.Object] = []
         if self.is_pcb:
             components = bpy.data.collections.get("Components")
             if not components:
                 return
+            sides = {"T": top_comps, "B": bot_comps}
             for comp in components.objects:
-                if "PCB_Side" not in comp.keys():  # type: ignore
-                    continue
                 if comp.library:
                     continue
-                if comp["PCB_Side"] == "T":
-                    top_comps.append(comp)
-                elif comp["PCB_Side"] == "B":
-                    bot_comps.append(comp)
+                if (side := sides.get(comp.get("PCB_Side"))) is not None:
+                    side.append(comp)
         else:
             top_comps = [obj for obj in objects if not obj.name.startswith("_") and not obj.library]
             bot_comps = top_comps.copy()
@@ -296,14 +288,20 @@ class Studio:
         if not hasattr(self, "animation_data") or not any(self.animation_data.values()) or default:
             return (1, config.blendcfg["RENDERER"]["FPS"])
 
-        x = min([action.frame_range.x for action in self.animation_data.values() if action])
-        y = max([action.frame_range.y for action in self.animation_data.values() if action])
+        x, y = float("inf"), float("-inf")
+        for action in self.animation_data.values():
+            if not action:
+                continue
+            start, end = action.frame_range
+            x = min(x, start)
+            y = max(y, end)
         return (int(x), int(y))
 
     def add_studio_keyframes(self, camera: Camera) -> None:
         """Add keyframes to studio objects on every frame from the user animation."""
+        frame_set = bpy.context.scene.frame_set
         for frame in range(self.frame_start, self.frame_end + 1):
-            bpy.context.scene.frame_set(frame)
+            frame_set(frame)
             Light.update(self.top_parent)
             Light.keyframe_all(frame)
 
@@ -311,9 +309,9 @@ class Studio:
             Background.keyframe_all(frame)
 
             camera.add_intermediate_keyframe(
-                rendered_obj=self.rendered_obj, frame=frame, frame_selected=True, focus=True
+                rendered_obj=self.rendered_obj, frame=frame, frame_selected=True, focus=True, set_frame=False
             )
-        bpy.context.scene.frame_set(self.frame_start)
+        frame_set(self.frame_start)
 
     @staticmethod
     def clear_animation_data() -> None: